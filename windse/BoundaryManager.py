@@ -8,10 +8,11 @@ import os
 from pyadjoint.tape import no_annotations
 
 ### Get the name of program importing this package ###
-if hasattr(__main__,"__file__"):
-    main_file = os.path.basename(__main__.__file__)
+### WINDSE_DOCS_BUILD forces the documentation path deterministically ###
+if os.environ.get("WINDSE_DOCS_BUILD"):
+    main_file = "sphinx-build"
 else:
-    main_file = "ipython"
+    main_file = os.path.basename(getattr(__main__, "__file__", "ipython"))
 
 ### This checks if we are just doing documentation ###
 if not main_file in ["sphinx-build", "__main__.py"]:
@@ -231,53 +232,54 @@ class GenericBoundary(object):
         self.fprint("")
 
     def PrepareVelocity(self,inflow_angle):
-        length = len(self.unit_reference_velocity)
-        ux_com = np.zeros(length)
-        uy_com = np.zeros(length)
-        uz_com = np.zeros(length)
-
         if self.dom.dim == 3:
             self.inflow_unit_vector = as_vector((cos(inflow_angle),sin(inflow_angle),0.0))
         else:
             self.inflow_unit_vector = as_vector((cos(inflow_angle),sin(inflow_angle)))
 
-        for i in range(length):
-            v = self.HH_vel * self.unit_reference_velocity[i]
-            ux_com[i] = self.inflow_unit_vector[0]*v
-            uy_com[i] = self.inflow_unit_vector[1]*v
-            if self.dom.dim == 3:
-                uz_com[i] = 0.0   
+        ### Rotate the reference profile in a single numpy pass over the dofs ###
+        vel = self.HH_vel * self.unit_reference_velocity
+        ux_com = math.cos(float(inflow_angle))*vel
+        uy_com = math.sin(float(inflow_angle))*vel
+        uz_com = np.zeros(len(vel))
         return [ux_com,uy_com,uz_com]
 
     def RecomputeVelocity(self,inflow_angle):
         self.fprint("Recomputing Velocity")
-        ux_com, uy_com, uz_com = self.PrepareVelocity(inflow_angle)
 
-        self.ux = Function(self.fs.V0)
-        self.uy = Function(self.fs.V1)
-        if self.dom.dim == 3:
-            self.uz = Function(self.fs.V2)
+        ### Optimization outer loops sweep the same angle schedule many
+        ### times, so keep the rotated component arrays from earlier
+        ### visits instead of rebuilding them ###
+        if not hasattr(self, "velocity_cache"):
+            self.velocity_cache = {}
+        key = (round(float(inflow_angle),10),float(self.HH_vel))
+        if key in self.velocity_cache:
+            ux_com, uy_com, uz_com = self.velocity_cache[key]
+            if self.dom.dim == 3:
+                self.inflow_unit_vector = as_vector((cos(inflow_angle),sin(inflow_angle),0.0))
+            else:
+                self.inflow_unit_vector = as_vector((cos(inflow_angle),sin(inflow_angle)))
+        else:
+            ux_com, uy_com, uz_com = self.PrepareVelocity(inflow_angle)
+            self.velocity_cache[key] = (ux_com, uy_com, uz_com)
 
+        ### Update the existing boundary functions in place; anything holding
+        ### a reference to them (forms, markers, files) stays valid ###
         self.ux.vector()[:] = ux_com
         self.uy.vector()[:] = uy_com
         if self.dom.dim == 3:
             self.uz.vector()[:] = uz_com
 
         ### Assigning Velocity
-        self.bc_velocity = Function(self.fs.V)
         self.bc_velocity.rename("bc_velocity","bc_velocity")
-        
+
         if self.dom.dim == 3:
             self.fs.VelocityAssigner.assign(self.bc_velocity,[self.ux,self.uy,self.uz])
         else:
             self.fs.VelocityAssigner.assign(self.bc_velocity,[self.ux,self.uy])
-        
-        ### Create Pressure Boundary Function
-        self.bc_pressure = Function(self.fs.Q)
 
-        ### Create Initial Guess
+        ### Update Initial Guess
         self.fprint("Assigning Initial Guess")
-        self.u0 = Function(self.fs.W)
         self.fs.SolutionAssigner.assign(self.u0,[self.bc_velocity,self.bc_pressure])
 
         self.SetupBoundaries()
@@ -289,8 +291,10 @@ class GenericBoundary(object):
         """
         This function saves the turbine force if exists to output/.../functions/
         """
-        self.bc_velocity.vector()[:]=self.bc_velocity.vector()[:]/self.dom.xscale
-        self.dom.mesh.coordinates()[:]=self.dom.mesh.coordinates()[:]/self.dom.xscale
+        ### Scale in place (PETSc VecScale) instead of copying through numpy ###
+        bc_u_vec = self.bc_velocity.vector()
+        bc_u_vec *= 1.0/self.dom.xscale
+        self.dom.mesh.coordinates()[:] /= self.dom.xscale
 
         if self.ig_first_save:
             self.u0_file = self.params.Save(self.bc_velocity,"u0",subfolder="functions/",val=val)
@@ -299,16 +303,18 @@ class GenericBoundary(object):
         else:
             self.params.Save(self.bc_velocity,"u0",subfolder="functions/",val=val,file=self.u0_file)
             self.params.Save(self.bc_pressure,"p0",subfolder="functions/",val=val,file=self.p0_file)
-        self.bc_velocity.vector()[:]=self.bc_velocity.vector()[:]*self.dom.xscale
-        self.dom.mesh.coordinates()[:]=self.dom.mesh.coordinates()[:]*self.dom.xscale
+        bc_u_vec *= self.dom.xscale
+        self.dom.mesh.coordinates()[:] *= self.dom.xscale
 
     def SaveHeight(self,val=0):
         """
         This function saves the turbine force if exists to output/.../functions/
         """
-        self.dom.mesh.coordinates()[:]=self.dom.mesh.coordinates()[:]/self.dom.xscale
-        self.height.vector()[:]=self.height.vector()[:]/self.dom.xscale
-        self.depth.vector()[:]=self.depth.vector()[:]/self.dom.xscale
+        self.dom.mesh.coordinates()[:] /= self.dom.xscale
+        height_vec = self.height.vector()
+        depth_vec = self.depth.vector()
+        height_vec *= 1.0/self.dom.xscale
+        depth_vec *= 1.0/self.dom.xscale
         if self.height_first_save:
             self.height_file = self.params.Save(self.height,"height",subfolder="functions/",val=val)
             self.depth_file = self.params.Save(self.depth,"depth",subfolder="functions/",val=val)
@@ -316,9 +322,9 @@ class GenericBoundary(object):
         else:
             self.params.Save(self.height,"height",subfolder="functions/",val=val,file=self.height_file)
             self.params.Save(self.depth,"depth",subfolder="functions/",val=val,file=self.depth_file)
-        self.height.vector()[:]=self.height.vector()[:]*self.dom.xscale
-        self.depth.vector()[:]=self.depth.vector()[:]*self.dom.xscale
-        self.dom.mesh.coordinates()[:]=self.dom.mesh.coordinates()[:]*self.dom.xscale
+        height_vec *= self.dom.xscale
+        depth_vec *= self.dom.xscale
+        self.dom.mesh.coordinates()[:] *= self.dom.xscale
 
     def CalculateHeights(self):
         ### Calculate the distance to the ground for the Q function space ###
@@ -327,9 +333,7 @@ class GenericBoundary(object):
         self.depth = Function(self.fs.Q)
         Q_coords = self.fs.Q.tabulate_dof_coordinates()
         print(f"|    |    Rank {self.params.rank}: N Coords: {len(Q_coords)}, N Dofs: {len(self.height.vector().get_local())}")
-        height_vals = self.height.vector()[:]
-        for i in range(len(Q_coords)):
-            height_vals[i] = self.dom.Ground(Q_coords[i,0],Q_coords[i,1])
+        height_vals = self.dom.Ground(Q_coords[:,0],Q_coords[:,1])
         z_dist_Q = Q_coords[:,2]-height_vals
         self.height.vector()[:]=height_vals
         self.depth.vector()[:]=z_dist_Q
@@ -337,9 +341,7 @@ class GenericBoundary(object):
         ### Calculate the distance to the ground for the V function space ###
         self.depth_V = Function(self.fs.V)
         V_coords = self.fs.V.tabulate_dof_coordinates()
-        z_dist_V_val = np.zeros(len(V_coords))
-        for i in range(len(V_coords)):
-            z_dist_V_val[i] = V_coords[i,2]-self.dom.Ground(V_coords[i,0],V_coords[i,1])
+        z_dist_V_val = V_coords[:,2]-self.dom.Ground(V_coords[:,0],V_coords[:,1])
         self.depth_V.vector()[:]=z_dist_V_val
 
         self.V0_coords = self.fs.V0.tabulate_dof_coordinates()
@@ -389,7 +391,18 @@ class UniformInflow(GenericBoundary):
         self.fprint("Assigning Initial Guess")
         if self.params["solver"]["type"] == "steady" and self.dom.dim == 3:
             # We need to have a non-constant initial guess otherwise the nu_T calculation is nan in 3D for steady problems
-            self.u0 = project(Expression(("HH_vel*(x[2]-z0)/(z1-z0)","0","0","0"),degree=1,HH_vel = self.HH_vel, z0 = self.dom.z_range[0],z1 = self.dom.z_range[1], y0 = self.dom.y_range[0],y1 = self.dom.y_range[1]),self.fs.W, solver_type='gmres',preconditioner_type="hypre_amg",**self.extra_kwarg)
+            # Evaluate the linear profile directly at the dof coordinates instead
+            # of JIT compiling an Expression and solving a projection system
+            z0 = self.dom.z_range[0]
+            z1 = self.dom.z_range[1]
+            ux0 = Function(self.fs.V0)
+            uy0 = Function(self.fs.V1)
+            uz0 = Function(self.fs.V2)
+            ux0.vector()[:] = self.HH_vel*(self.V0_coords[:,2]-z0)/(z1-z0)
+            u0_vel = Function(self.fs.V)
+            self.fs.VelocityAssigner.assign(u0_vel,[ux0,uy0,uz0])
+            self.u0 = Function(self.fs.W)
+            self.fs.SolutionAssigner.assign(self.u0,[u0_vel,self.bc_pressure])
         else:
             self.u0 = Function(fs.W)
             self.fs.SolutionAssigner.assign(self.u0,[self.bc_velocity,self.bc_pressure])
@@ -561,9 +574,12 @@ class TurbSimInflow(LogLayerInflow):
             raise ValueError("Please provide the path to the turbsim data")
 
         ### Load Turbsim Data ###
-        uTotal = np.load(self.turbsim_path+'turb_u.npy')
-        vTotal = np.load(self.turbsim_path+'turb_v.npy')
-        wTotal = np.load(self.turbsim_path+'turb_w.npy')
+        ### Memory-map the arrays so each timestep only pages in the two
+        ### time slices it interpolates between, instead of reading the
+        ### whole series into every rank up front ###
+        uTotal = np.load(self.turbsim_path+'turb_u.npy', mmap_mode='r')
+        vTotal = np.load(self.turbsim_path+'turb_v.npy', mmap_mode='r')
+        wTotal = np.load(self.turbsim_path+'turb_w.npy', mmap_mode='r')
 
         ### Extract number of data points ###
         ny = np.shape(uTotal)[1]
@@ -585,41 +601,35 @@ class TurbSimInflow(LogLayerInflow):
         tol = 1e-6
 
         ##### FIX MAKE WORK FOR ALL BOUNDARY INFLOW ####
-        # Iterate and fine the boundary IDs
-        self.boundaryIDs = []
-        for k, pos in enumerate(self.V0_coords):
-            if pos[0] < self.dom.x_range[0] + tol:
-                self.boundaryIDs.append(k)
+        # Locate the boundary IDs with a single mask
+        self.boundaryIDs = np.where(self.V0_coords[:, 0] < self.dom.x_range[0] + tol)[0]
+
+        # The (z, y) part of the interpolation points never changes between
+        # calls, so build the query array once and only update the time column
+        self.boundary_query = np.zeros((len(self.boundaryIDs), 3))
+        self.boundary_query[:, 0] = self.V0_coords[self.boundaryIDs, 2]
+        self.boundary_query[:, 1] = self.V0_coords[self.boundaryIDs, 1]
 
         self.UpdateVelocity(0.0)
         self.DebugOutput()
 
     def UpdateVelocity(self, simTime):
 
-        # Define tolerance
-        tol = 1e-6
-
         loc_ux = self.ux.vector().get_local()
         loc_uy = self.uy.vector().get_local()
         loc_uz = self.uz.vector().get_local()
 
-        # Interpolate a value at each boundary coordinate
-        for k in self.boundaryIDs:
-            # Get the position corresponding to this boundary id
-            pos = self.V0_coords[k, :]
-
-            # The interpolation point specifies a 3D (z, y, time) point
-            xi = np.array([pos[2], pos[1], simTime])
+        # Interpolate all boundary coordinates with one batched call per
+        # component; the query points are 3D (z, y, time) points
+        self.boundary_query[:, 2] = simTime
 
-            # This method breaks in parallel
-            # self.ux.vector()[k] = self.interp_u(xi)
-            # self.uy.vector()[k] = self.interp_v(xi)
-            # self.uz.vector()[k] = self.interp_w(xi)
+        # This method breaks in parallel
+        # self.ux.vector()[k] = self.interp_u(xi)
 
-            # Get the interpolated value at this point
-            loc_ux[k] = self.interp_u(xi)
-            loc_uy[k] = self.interp_v(xi)
-            loc_uz[k] = self.interp_w(xi)
+        # Get the interpolated values at the boundary points
+        loc_ux[self.boundaryIDs] = self.interp_u(self.boundary_query)
+        loc_uy[self.boundaryIDs] = self.interp_v(self.boundary_query)
+        loc_uz[self.boundaryIDs] = self.interp_w(self.boundary_query)
 
         # This is safer in parallel
         self.ux.vector()[:] = (loc_ux)
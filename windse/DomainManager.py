@@ -9,10 +9,11 @@ import os
 from pyadjoint.tape import no_annotations
 
 ### Get the name of program importing this package ###
-if hasattr(__main__,"__file__"):
-    main_file = os.path.basename(__main__.__file__)
+### WINDSE_DOCS_BUILD forces the documentation path deterministically ###
+if os.environ.get("WINDSE_DOCS_BUILD"):
+    main_file = "sphinx-build"
 else:
-    main_file = "ipython"
+    main_file = os.path.basename(getattr(__main__, "__file__", "ipython"))
 
 ### This checks if we are just doing documentation ###
 if not main_file in ["sphinx-build", "__main__.py"]:
@@ -36,12 +37,6 @@ if not main_file in ["sphinx-build", "__main__.py"]:
     if windse_parameters.dolfin_adjoint:
         from dolfin_adjoint import *
         
-    ### This import improves the plotter functionality on Mac ###
-    if platform == 'darwin':
-        import matplotlib
-        matplotlib.use('TKAgg')
-    import matplotlib.pyplot as plt
-
     ### This parameter allows for refining the mesh functions ###
     parameters["refinement_algorithm"] = "plaza_with_parent_facets"
 
@@ -242,8 +237,14 @@ class GenericDomain(object):
 
         ### Check if folder exists ###
         # if not os.path.exists(folder_string): os.makedirs(folder_string)
-        if not os.path.exists(folder_string) and self.params.rank == 0: os.makedirs(folder_string)
+        if self.params.rank == 0: os.makedirs(folder_string, exist_ok=True)
 
+        ### matplotlib is only needed here, so import it lazily; TKAgg
+        ### improves the interactive plotter on Mac ###
+        if platform == 'darwin':
+            import matplotlib
+            matplotlib.use('TKAgg')
+        import matplotlib.pyplot as plt
 
         p=plot(self.mesh)
         plt.savefig(file_string)
@@ -291,7 +292,7 @@ class GenericDomain(object):
 
     def ExportMesh(self):
         folder_string = self.params.folder+"mesh/exported_mesh/"
-        if not os.path.exists(folder_string): os.makedirs(folder_string)
+        os.makedirs(folder_string, exist_ok=True)
         if self.filetype == "xml.gz":
             File(folder_string+"mesh.xml.gz") << self.mesh
             File(folder_string+"boundaries.xml.gz") << self.boundary_markers
@@ -771,10 +772,15 @@ class GenericDomain(object):
 
 
         def InterplatedGroundFunction(x,y,dx=0,dy=0):
+            ### grid=False evaluates pointwise, so x and y may be scalars
+            ### or equal-length arrays interpolated in one spline call ###
             if dx == 0 and dy == 0:
-                return float(self.terrain_interpolated(x,y)[0]+self.ground_reference)
+                z = self.terrain_interpolated(x,y,grid=False)+self.ground_reference
             else:
-                return float(self.terrain_interpolated(x,y,dx=dx,dy=dy)[0])
+                z = self.terrain_interpolated(x,y,dx=dx,dy=dy,grid=False)
+            if np.ndim(z) == 0:
+                return float(z)
+            return z
 
         self.ground_function = InterplatedGroundFunction
 
@@ -859,6 +865,15 @@ class GenericDomain(object):
                 if nx != ny:
                     raise ValueError("Length mismatch: len(x)="+repr(nx)+", len(y)="+repr(ny))
                 else:
+                    ### Try one batched evaluation first; ground functions
+                    ### built from splines or plain arithmetic accept
+                    ### arrays directly, which avoids nx Python calls ###
+                    try:
+                        z = np.asarray(self.ground_function(np.asarray(x),np.asarray(y),dx=dx,dy=dy),dtype=float)
+                        if z.shape == (nx,):
+                            return z
+                    except (TypeError, ValueError):
+                        pass
                     z = np.zeros(nx)
                     for i in range(nx):
                         z[i] = float(self.ground_function(x[i],y[i],dx=dx,dy=dy))
@@ -17,10 +17,11 @@ import os
 from pyadjoint.tape import no_annotations
 
 ### Get the name of program importing this package ###
-if hasattr(__main__,"__file__"):
-    main_file = os.path.basename(__main__.__file__)
+### WINDSE_DOCS_BUILD forces the documentation path deterministically ###
+if os.environ.get("WINDSE_DOCS_BUILD"):
+    main_file = "sphinx-build"
 else:
-    main_file = "ipython"
+    main_file = os.path.basename(getattr(__main__, "__file__", "ipython"))
     
 ### This checks if we are just doing documentation ###
 if not main_file in ["sphinx-build", "__main__.py"]:
@@ -574,7 +575,7 @@ class Optimizer(object):
             der = self.Jhat.derivative()
 
         folder_string = self.params.folder+"data/"
-        if not os.path.exists(folder_string): os.makedirs(folder_string)
+        os.makedirs(folder_string, exist_ok=True)
         f = open(folder_string+"gradient_data.txt",'w')
         f_header = "control    value    derivative"
         f.write(f_header+"\n")
@@ -638,7 +639,7 @@ class Optimizer(object):
     def SaveControls(self,m):
 
         folder_string = self.params.folder+"/data/"
-        if not os.path.exists(folder_string): os.makedirs(folder_string)
+        os.makedirs(folder_string, exist_ok=True)
 
         # new_values = {}
         # m_f = np.array(self.control_pointers,dtype=float)
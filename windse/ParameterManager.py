@@ -12,10 +12,11 @@ import copy
 
 
 ### Get the name of program importing this package ###
-if hasattr(__main__,"__file__"):
-    main_file = os.path.basename(__main__.__file__)
+### WINDSE_DOCS_BUILD forces the documentation path deterministically ###
+if os.environ.get("WINDSE_DOCS_BUILD"):
+    main_file = "sphinx-build"
 else:
-    main_file = "ipython"
+    main_file = os.path.basename(getattr(__main__, "__file__", "ipython"))
     
 ### This checks if we are just doing documentation ###
 if not main_file in ["sphinx-build", "__main__.py"]:
@@ -416,7 +417,7 @@ class Parameters(dict):
 
         if file is None:
             ### Make sure the folder exists
-            if not os.path.exists(self.folder+subfolder) and self.rank == 0: os.makedirs(self.folder+subfolder)
+            if self.rank == 0: os.makedirs(self.folder+subfolder, exist_ok=True)
 
             if filetype == "pvd":
                 file_string = self.folder+subfolder+filename+".pvd"
@@ -424,7 +425,16 @@ class Parameters(dict):
                 out << (func,val)
             elif filetype == "xdmf":
                 file_string = self.folder+subfolder+filename+".xdmf"
-                out = dolfin.XDMFFile(file_string)
+                ### Pass the mesh communicator explicitly so the HDF5 writes
+                ### are collective (MPI-IO) instead of per-rank files ###
+                out = dolfin.XDMFFile(func.function_space().mesh().mpi_comm(),file_string)
+                ### The mesh is identical for every write, so only store it
+                ### once per file instead of once per time value ###
+                out.parameters["rewrite_function_mesh"] = False
+                out.parameters["functions_share_mesh"] = True
+                ### Buffer time-series writes in HDF5 and flush on close
+                ### rather than rewriting metadata every step ###
+                out.parameters["flush_output"] = False
                 out.write(func,val)
 
             func.rename(old_filename,old_filename)
@@ -447,7 +457,7 @@ class Parameters(dict):
             out_f = subfolder
 
             ### Check if folder exists ###
-            if not os.path.exists(out_f): os.makedirs(out_f, exist_ok=True)
+            os.makedirs(out_f, exist_ok=True)
 
             ### Open the file ###
             f = open(out_f+filename+".csv",mode)
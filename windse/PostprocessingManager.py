@@ -9,10 +9,11 @@ import os
 from pyadjoint.tape import no_annotations
 
 ### Get the name of program importing this package ###
-if hasattr(__main__,"__file__"):
-    main_file = os.path.basename(__main__.__file__)
+### WINDSE_DOCS_BUILD forces the documentation path deterministically ###
+if os.environ.get("WINDSE_DOCS_BUILD"):
+    main_file = "sphinx-build"
 else:
-    main_file = "ipython"
+    main_file = os.path.basename(getattr(__main__, "__file__", "ipython"))
 
 ### This checks if we are just doing documentation ###
 if not main_file in ["sphinx-build", "__main__.py"]:
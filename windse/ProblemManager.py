@@ -8,10 +8,11 @@ import os
 from pyadjoint.tape import no_annotations
 
 ### Get the name of program importing this package ###
-if hasattr(__main__,"__file__"):
-    main_file = os.path.basename(__main__.__file__)
+### WINDSE_DOCS_BUILD forces the documentation path deterministically ###
+if os.environ.get("WINDSE_DOCS_BUILD"):
+    main_file = "sphinx-build"
 else:
-    main_file = "ipython"
+    main_file = os.path.basename(getattr(__main__, "__file__", "ipython"))
     
 ### This checks if we are just doing documentation ###
 if not main_file in ["sphinx-build", "__main__.py"]:
@@ -126,6 +127,10 @@ class GenericProblem(object):
         else:
             tf = self.farm.compute_turbine_force(u,inflow_angle,self.fs,**kwargs)
 
+        ### Any cached power forms reference the old turbine force, so drop them ###
+        if hasattr(self.farm,"power_forms"):
+            del self.farm.power_forms
+
         tf_stop = time.time()
         self.fprint("Turbine Force Calculated: {:1.2f} s".format(tf_stop-tf_start),special="footer")
         return tf
@@ -146,10 +151,17 @@ class GenericProblem(object):
 
             if self.turbulence_model == 'smagorinsky':
                 # Smagorinsky constant, typically around 0.17
-                Cs = 0.17
+                # (a Constant coefficient so sweeps reuse the compiled form)
+                Cs = Constant(0.17, name="Cs")
 
                 # Define filter scale (all models use this)
-                filter_scale = CellVolume(self.dom.mesh)**(1.0/self.dom.dim)
+                # Precompute h = V_cell^(1/dim) per cell so the assembled
+                # kernel loads one scalar instead of evaluating pow at
+                # every quadrature point
+                DG0 = FunctionSpace(self.dom.mesh,"DG",0)
+                filter_scale = Function(DG0, name="filter_scale")
+                cell_volumes = assemble(TestFunction(DG0)*dx,**self.extra_kwarg).get_local()
+                filter_scale.vector()[:] = np.power(cell_volumes,1.0/self.dom.dim)
 
                 # Eddy viscosity
                 nu_T = Cs**2 * filter_scale**2 * strainMag
@@ -159,18 +171,20 @@ class GenericProblem(object):
                 vonKarman = 0.41
 
                 if self.dom.dim == 3:
-                    depth = self.bd.depth.vector()[:]
+                    # Compute the mixing length in place on the local dof array
+                    # so the von Karman scaling is only evaluated once
+                    l_mix_vals = self.bd.depth.vector().get_local()
+                    l_mix_vals *= vonKarman
+                    l_mix_vals /= 1.0 + l_mix_vals/self.lmax
                 else:
                     if self.farm.numturbs == 0:
                         depth = self.params["boundary_conditions"]["vel_height"]
                     else:
                         depth = self.farm.turbines[0].HH
-
-                numer = vonKarman*depth
-                denom = 1.0 + vonKarman*depth/self.lmax
+                    l_mix_vals = vonKarman*depth/(1.0 + vonKarman*depth/self.lmax)
 
                 l_mix = Function(self.fs.Q)
-                l_mix.vector()[:] = numer/denom
+                l_mix.vector()[:] = l_mix_vals
                 l_mix.rename("l_mix","l_mix")
 
                 # Eddy viscosity
@@ -277,8 +291,20 @@ class StabilizedProblem(GenericProblem):
 
 
     def ComputeFunctional(self,inflow_angle):
+        ### If the form was already built, just update the angle coefficient ###
+        ### This avoids re-JITing the same form for every wind angle ###
+        if hasattr(self,"minflow_angle") and inflow_angle is not None:
+            self.fprint("Updating Stabilized Problem Wind Angle")
+            self.minflow_angle.assign(float(inflow_angle))
+            return
+
         self.fprint("Setting Up Stabilized Problem",special="header")
 
+        ### Wrap the inflow angle in a Constant so it can be updated without rebuilding the form ###
+        if inflow_angle is not None:
+            self.minflow_angle = Constant(float(inflow_angle), name="inflow_angle")
+            inflow_angle = self.minflow_angle
+
         ### Create the test/trial/functions ###
         self.up_k = Function(self.fs.W)
         self.u_k,self.p_k = split(self.up_k)
@@ -300,7 +326,7 @@ class StabilizedProblem(GenericProblem):
         f = Constant((0.0,)*self.dom.dim)
         f.rename("f","f")
         
-        nu = self.viscosity
+        nu = Constant(self.viscosity, name="viscosity")
         vonKarman=0.41
         eps=Constant(self.stability_eps)
         eps.rename("eps","eps")
@@ -316,25 +342,45 @@ class StabilizedProblem(GenericProblem):
         self.vertKE= self.ReyStress[0,2]*self.u_k[0]
 
         ### Create the functional ###
-        self.F = inner(grad(self.u_k)*self.u_k, v)*dx
-        self.F +=   Sx*Sx*(nu+self.nu_T)*inner(grad(self.u_k), grad(v))*dx
-        self.F += - inner(div(v),self.p_k)*dx
-        self.F += - inner(div(self.u_k),q)*dx
-        self.F += - inner(f,v)*dx
-        self.F += - inner(self.tf,v)*dx 
+        ### Hoist the shared subexpressions and build the residual as one
+        ### expression so the form compiler can share the subtrees ###
+        grad_u = grad(self.u_k)
+        u_dot_grad_u = grad_u*self.u_k
+        nu_tot = nu + self.nu_T
+        self.F =   inner(u_dot_grad_u, v)*dx \
+                 + Sx*Sx*nu_tot*inner(grad_u, grad(v))*dx \
+                 - inner(div(v),self.p_k)*dx \
+                 - inner(div(self.u_k),q)*dx \
+                 - inner(f,v)*dx \
+                 - inner(self.tf,v)*dx
 
 
         # Add body force to functional
         if abs(float(self.mbody_force)) >= 1e-14:
             self.fprint("Using Body Force")
-            self.F += inner(-self.mbody_force*self.bd.inflow_unit_vector,v)*dx
+            ### Build the direction from the angle Constant so the cached
+            ### form rotates when minflow_angle is reassigned; the boundary
+            ### manager rebinds its unit vector every angle, which a stored
+            ### form would never see ###
+            if inflow_angle is not None:
+                if self.dom.dim == 3:
+                    body_force_direction = as_vector((cos(inflow_angle),sin(inflow_angle),0.0))
+                else:
+                    body_force_direction = as_vector((cos(inflow_angle),sin(inflow_angle)))
+            else:
+                body_force_direction = self.bd.inflow_unit_vector
+            self.F += inner(-self.mbody_force*body_force_direction,v)*dx
 
         ################ THIS IS A CHEAT ####################\
         if self.use_corrective_force:
             self.fprint("Using Corrective Force")
-            extra_S = sqrt(2*inner(0.5*(grad(self.bd.bc_velocity)+grad(self.bd.bc_velocity).T),0.5*(grad(self.bd.bc_velocity)+grad(self.bd.bc_velocity).T)))
+            extra_Sij = sym(grad(self.bd.bc_velocity))
+            extra_S = sqrt(2*inner(extra_Sij,extra_Sij))
             extra_l_mix = Function(self.fs.Q)
-            extra_l_mix.vector()[:] = np.divide(vonKarman*self.bd.depth.vector()[:]/Sx,(1.+np.divide(vonKarman*self.bd.depth.vector()[:]/Sx,self.lmax)))
+            extra_l_mix_vals = self.bd.depth.vector().get_local()
+            extra_l_mix_vals *= vonKarman/Sx
+            extra_l_mix_vals /= 1.0 + extra_l_mix_vals/self.lmax
+            extra_l_mix.vector()[:] = extra_l_mix_vals
             extra_nu_T = extra_l_mix**2.*extra_S
             extra_DP =dot(self.bd.u0,grad(self.bd.u0)) - div((nu+extra_nu_T)*grad(self.bd.bc_velocity))
 
@@ -349,7 +395,7 @@ class StabilizedProblem(GenericProblem):
         ### Add in the Stabilizing term ###
         if abs(float(eps)) >= 1e-14:
             self.fprint("Using Stabilization Term")
-            stab = - eps*inner(grad(q), grad(self.p_k))*dx - eps*inner(grad(q), dot(grad(self.u_k), self.u_k))*dx 
+            stab = - eps*inner(grad(q), grad(self.p_k))*dx - eps*inner(grad(q), u_dot_grad_u)*dx
             self.F += stab
 
 
@@ -389,13 +435,25 @@ class TaylorHoodProblem(GenericProblem):
         self.DebugOutput()
 
     def ComputeFunctional(self,inflow_angle):
+        ### If the form was already built, just update the angle coefficient ###
+        ### so the turbine force and functional are reused across angles ###
+        if hasattr(self,"minflow_angle") and inflow_angle is not None:
+            self.fprint("Updating Taylor-Hood Problem Wind Angle")
+            self.minflow_angle.assign(float(inflow_angle))
+            return
+
         self.fprint("Setting Up Taylor-Hood Problem",special="header")
 
+        ### Wrap the inflow angle in a Constant so it can be updated without rebuilding the form ###
+        if inflow_angle is not None:
+            self.minflow_angle = Constant(float(inflow_angle), name="inflow_angle")
+            inflow_angle = self.minflow_angle
+
         ### These constants will be moved into the params file ###
         f = Constant((0.0,)*self.dom.dim)
         vonKarman=0.41
         eps=Constant(0.01)
-        nu = self.viscosity
+        nu = Constant(self.viscosity, name="viscosity")
 
 
         self.fprint("Viscosity:         {:1.2e}".format(float(self.viscosity)))
@@ -422,7 +480,16 @@ class TaylorHoodProblem(GenericProblem):
         # Add body force to functional
         if abs(float(self.mbody_force)) >= 1e-14:
             self.fprint("Using Body Force")
-            self.F += inner(-self.mbody_force*self.bd.inflow_unit_vector,v)*dx
+            ### Same as the stabilized problem: tie the direction to the
+            ### angle Constant so the cached form follows angle updates ###
+            if inflow_angle is not None:
+                if self.dom.dim == 3:
+                    body_force_direction = as_vector((cos(inflow_angle),sin(inflow_angle),0.0))
+                else:
+                    body_force_direction = as_vector((cos(inflow_angle),sin(inflow_angle)))
+            else:
+                body_force_direction = self.bd.inflow_unit_vector
+            self.F += inner(-self.mbody_force*body_force_direction,v)*dx
 
         if self.use_25d_model:
             if self.dom.dim == 3:
@@ -704,6 +771,13 @@ class UnsteadyProblem(GenericProblem):
         self.a1 = lhs(F1)
         self.L1 = rhs(F1)
 
+        # Split the step 1 operator so the solver can pre-assemble the
+        # time-independent mass matrix once and rescale it by 1/dt, leaving
+        # only the advection/diffusion terms to re-integrate every step
+        self.a1_mass = inner(u, v)*dx
+        self.a1_ops = lhs(inner(dot(U_AB, nabla_grad(U_CN)), v)*dx \
+                    + (nu_c+self.nu_T)*inner(grad(U_CN), grad(v))*dx)
+
         # Define variational problem for step 2: pressure correction
         # self.a2 = dot(nabla_grad(p), nabla_grad(q))*dx
         # self.L2 = dot(nabla_grad(self.p_k1), nabla_grad(q))*dx - (1.0/self.dt_c)*div(self.u_k)*q*dx
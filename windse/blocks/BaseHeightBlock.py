@@ -2,16 +2,50 @@ from pyadjoint.block import Block
 from . import Constant
 
 class BaseHeightBlock(Block):
-    '''This is the Block class that will be used to calculate adjoint 
+    '''This is the Block class that will be used to calculate adjoint
     information for optimizations. '''
+
+    ### The ground lookup is comparatively expensive and tape sweeps
+    ### revisit the same base location many times, so keep values and
+    ### derivatives keyed on position. The caches are shared across
+    ### instances: turbines sitting on the same (x, y) then cost one
+    ### lookup between them instead of one each ###
+    value_cache = {}
+    adj_cache = {}
+    cache_limit = 4096
+
     def __init__(self, x, y, ground=None):
         super(BaseHeightBlock, self).__init__()
         self.x = x
         self.y = y
         self.ground = ground
+        self.ground_key = self._ground_key(ground)
         self.add_dependency(x)
         self.add_dependency(y)
 
+    @staticmethod
+    def _ground_key(ground):
+        ### Every turbine passes its own bound-method object for the same
+        ### domain Ground, so key on the receiver to share cache entries ###
+        return id(getattr(ground, "__self__", ground))
+
+    @classmethod
+    def prefill(cls, ground, xs, ys):
+        """
+        This function warms the shared caches with a single batched ground
+        call per field (height and both partials) for a whole set of
+        turbine locations, replacing one scalar lookup per turbine during
+        the first tape walk.
+        """
+        gkey = cls._ground_key(ground)
+        h  = ground(xs,ys)
+        hx = ground(xs,ys,dx=1)
+        hy = ground(xs,ys,dy=1)
+        for i in range(len(xs)):
+            key = (float(xs[i]), float(ys[i]), gkey)
+            cls.value_cache[key] = Constant(float(h[i]))
+            cls.adj_cache[key] = (float(hx[i]), float(hy[i]))
+
     def __str__(self):
         return "BaseHeightBlock"
 
@@ -23,26 +57,35 @@ class BaseHeightBlock(Block):
     def recompute_component(self, inputs, block_variable, idx, prepared):
         x = prepared[0]
         y = prepared[1]
-        return Constant(self.ground(x,y))
+        ### Keying on the inputs keeps this safe across design updates:
+        ### the cached Constant is reused only while (x, y) are unchanged,
+        ### so no explicit freeze/unfreeze bookkeeping is needed ###
+        key = (float(x), float(y), self.ground_key)
+        if key not in self.value_cache:
+            if len(self.value_cache) >= self.cache_limit:
+                self.value_cache.clear()
+            self.value_cache[key] = Constant(float(self.ground(x,y)))
+        return self.value_cache[key]
 
     def prepare_evaluate_adj(self, inputs, adj_inputs, relevant_dependencies):
         x = inputs[0]
         y = inputs[1]
-        return [x, y]
 
-    def evaluate_adj_component(self, inputs, adj_inputs, block_variable, idx, prepared=None):
-        x = prepared[0]
-        y = prepared[1]
-        adj_input = adj_inputs[0]
+        ### Each reverse sweep needs both partials, so look them up
+        ### together here and let the per-component calls index the pair ###
+        key = (float(x), float(y), self.ground_key)
+        if key not in self.adj_cache:
+            if len(self.adj_cache) >= self.cache_limit:
+                self.adj_cache.clear()
+            self.adj_cache[key] = (self.ground(x,y,dx=1), self.ground(x,y,dy=1))
+        gx, gy = self.adj_cache[key]
 
-        # Compute derivative with respect to x
-        if idx == 0:
-            adj = self.ground(x,y,dx=1)
+        return [x, y, gx, gy]
 
-        # Compute derivative with respect to y
-        elif idx == 1:
-            adj = self.ground(x,y,dy=1)
+    def evaluate_adj_component(self, inputs, adj_inputs, block_variable, idx, prepared=None):
+        adj_input = adj_inputs[0]
 
-        adj_output = adj_input * adj
+        # Derivative with respect to x (idx 0) or y (idx 1)
+        adj_output = adj_input * prepared[2 + idx]
 
         return adj_output
@@ -81,11 +81,9 @@ class ControlUpdaterBlock(Block):
 
     def recompute_component(self, inputs, block_variable, idx, prepared):
         J = inputs[-1]
-        if self.problem.params["solver"]["type"] == "unsteady": 
-            u_k = inputs[-3]
-            p_k = inputs[-2]
-        else:
-            u_k, p_k = inputs[-2].split(True)
+        # u_k/p_k are only needed by the commented-out probes below; if
+        # re-enabling them use inputs[-3]/inputs[-2] for unsteady or the
+        # non-copying inputs[-2].split() views for steady, not split(True)
 
         # print(f"simTime =      {float(inputs[-6])}")
         # print(f"simTime_prev = {float(inputs[-5])}")
@@ -2,7 +2,7 @@
 from . import GenericTurbine
 
 # import dolfin functions
-from . import Constant, SpatialCoordinate, as_vector, cos, sin, exp, sqrt, dot, project, assemble, dx
+from . import Constant, SpatialCoordinate, as_vector, cos, sin, exp, sqrt, dot, project, assemble, dx, conditional, lt
 
 
 # import other modules
@@ -26,6 +26,7 @@ class ActuatorDisk(GenericTurbine):
         self.thickness = self.params["turbines"]["thickness"]
         self.axial     = self.params["turbines"]["axial"]
         self.force     = self.params["turbines"]["force"]
+        self.disk_kernel = self.params["turbines"]["disk_kernel"]
     
     def create_controls(self):
         self.mx     = Constant(self.x, name="x_{:d}".format(self.index))
@@ -62,12 +63,22 @@ class ActuatorDisk(GenericTurbine):
         ### Rotate and Shift the Turbine ###
         xs = self.yaw_turbine(x,x0,yaw)
 
-        ### Create the function that represents the Thickness of the turbine ###
-        T = exp(-pow((xs[0]/W),6.0))
-
-        ### Create the function that represents the Disk of the turbine
+        ### Create the functions that represent the Thickness and Disk of the turbine ###
         r = sqrt(xs[1]**2.0+xs[2]**2.0)/R
-        D = exp(-pow(r,6.0))
+        if self.disk_kernel == "polynomial":
+            ### Compactly supported C2 polynomial kernels: exactly zero outside
+            ### the disk and much cheaper to integrate than the exponentials ###
+            s2 = (xs[0]/W)**2.0
+            T = conditional(lt(s2,1.0),(1.0-s2)**4.0*(4.0*s2+1.0),0.0)
+            D = conditional(lt(r**2.0,1.0),(1.0-r**2.0)**4.0*(4.0*r**2.0+1.0),0.0)
+            T_norm = 256.0/231.0
+            if self.dom.dim == 3:
+                D_norm = np.pi/3.0
+            else:
+                D_norm = 256.0/231.0
+        else:
+            T = exp(-pow((xs[0]/W),6.0))
+            D = exp(-pow(r,6.0))
 
         ### Create the function that represents the force ###
         if self.force == "constant":
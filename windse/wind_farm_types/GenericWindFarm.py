@@ -1,5 +1,7 @@
 from windse import windse_parameters
 from windse.turbine_types import turbine_dict
+if windse_parameters.dolfin_adjoint:
+    from windse.blocks import BaseHeightBlock
 import numpy as np
 import time, os
 from . import MeshFunction, cells, project, FiniteElement, FunctionSpace, MixedElement, assemble, dx, parameters, Form, File
@@ -98,6 +100,15 @@ class GenericWindFarm(object):
         Using the parameters and initial locations this function will populate the list of turbines
         """
         turbine_method = turbine_dict[self.turbine_type]
+
+        ### Warm the shared base-height caches with one batched ground call
+        ### per field instead of a scalar lookup per turbine; match the
+        ### import guard above, which follows dolfin_adjoint alone ###
+        if self.params.dolfin_adjoint and self.params.performing_opt_calc and len(self.initial_turbine_locations) > 1:
+            BaseHeightBlock.prefill(self.dom.Ground,
+                                    self.initial_turbine_locations[:,0],
+                                    self.initial_turbine_locations[:,1])
+
         for i,(x,y) in enumerate(self.initial_turbine_locations):
             self.turbines.append(turbine_method(i,x,y,self.dom))
 
@@ -281,6 +292,9 @@ class GenericWindFarm(object):
         """
 
         ### Build the integrand
+        ### Note: this has to stay a UFL form assembled in one shot; the
+        ### power is used as an optimization objective and dolfin_adjoint
+        ### can only differentiate through assemble, not a dof-space kernel
         val = 0
         for turb in self.turbines:
             val += turb.power(u, inflow_angle)
@@ -302,16 +316,26 @@ class GenericWindFarm(object):
         J_list[0]=iter_val
         J_list[1]=simTime
         with stop_annotating():
-            for i,turb in enumerate(self.turbines):
+            ### Build the per-turbine power forms once; the controls enter
+            ### through Constants so the same form can be re-assembled on
+            ### every call instead of rebuilding the UFL integrand
+            if not hasattr(self,"power_forms"):
+                self.power_forms = [None]*self.numturbs
 
-                val = turb.power(u,inflow_angle)
+            for i,turb in enumerate(self.turbines):
 
-                ### Assemble if needed
-                if not isinstance(val,(float,AdjFloat)):
-                    J = assemble(val*dx)
+                if self.power_forms[i] is not None:
+                    J = assemble(self.power_forms[i])
                 else:
-                    J = val
-                    
+                    val = turb.power(u,inflow_angle)
+
+                    ### Assemble if needed
+                    if not isinstance(val,(float,AdjFloat)):
+                        self.power_forms[i] = val*dx
+                        J = assemble(self.power_forms[i])
+                    else:
+                        J = val
+
                 J_list[i+2] = J
 
         J_list[-1]=sum(J_list[2:])